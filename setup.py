@@ -1,7 +1,7 @@
 """Setup script for Chonkie's Cython extensions.
 
 This script configures the Cython extensions used in the Chonkie library.
-It includes the token_chunker, split, merge, and NumPy-free Savitzky-Golay extensions.
+It includes the token_chunker, split, merge, group, and NumPy-free Savitzky-Golay extensions.
 """
 import os
 
@@ -20,6 +20,10 @@ extensions = [
         "chonkie.chunker.c_extensions.merge",
         [os.path.join(c_extensions_dir, "merge.pyx")],
     ),
+    Extension(
+        "chonkie.chunker.c_extensions.group",
+        [os.path.join(c_extensions_dir, "group.pyx")],
+    ),
     # The -O3 compile flag was removed as it caused issues with re-installing
     # the package in editable mode.
     Extension(
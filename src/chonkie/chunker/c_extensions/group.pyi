@@ -0,0 +1,19 @@
+"""Stub file for group C extension."""
+
+from typing import List, Tuple
+
+def group_child_indices(
+    token_counts: List[int],
+    chunk_size: int
+) -> Tuple[List[int], List[int]]:
+    """Find the group boundaries for the children of a node from their token counts.
+
+    Args:
+        token_counts: Token count for each child node
+        chunk_size: Maximum tokens per group
+
+    Returns:
+        Tuple of (boundaries, group_token_counts)
+
+    """
+    ...
@@ -0,0 +1,71 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, nonecheck=False
+"""
+Optimized Cython implementation of the node grouping loop for CodeChunker.
+
+This module groups the children of a tree-sitter node into runs that fit in the chunk size,
+working only on the token counts of the children so that the loop runs over C integers
+instead of Python objects. Recursing into oversized children and merging the groups across
+recursion levels stays in Python, since it needs the nodes themselves.
+"""
+
+import cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_child_indices(list token_counts, long long chunk_size):
+    """
+    Find the group boundaries for the children of a node from their token counts.
+
+    Children are added to the current group until the next child would push it over the
+    chunk_size, at which point the group is closed. A child that is larger than the
+    chunk_size on its own is put in a group by itself, so that the caller can split it.
+
+    Args:
+        token_counts (list): Token count for each child node
+        chunk_size (int): Maximum allowed tokens per group
+
+    Returns:
+        tuple: (boundaries, group_token_counts)
+            - boundaries: Start index of every group, followed by the number of children
+            - group_token_counts: Total token count of every group
+
+    Example:
+        >>> group_child_indices([2, 2, 9, 1, 3], 4)
+        ([0, 2, 3, 5], [4, 9, 4])
+    """
+    cdef Py_ssize_t num_children = len(token_counts)
+    cdef Py_ssize_t i
+    cdef long long token_count
+    cdef long long current_token_count = 0
+    cdef Py_ssize_t current_start = 0
+    cdef list boundaries = []
+    cdef list group_token_counts = []
+
+    for i in range(num_children):
+        token_count = token_counts[i]
+        if token_count > chunk_size:
+            # Close whatever was there already and put the oversized child on its own
+            if i > current_start:
+                boundaries.append(current_start)
+                group_token_counts.append(current_token_count)
+            boundaries.append(i)
+            group_token_counts.append(token_count)
+            current_start = i + 1
+            current_token_count = 0
+        elif current_token_count + token_count > chunk_size:
+            # Close the current group and start a new one with this child
+            boundaries.append(current_start)
+            group_token_counts.append(current_token_count)
+            current_start = i
+            current_token_count = token_count
+        else:
+            current_token_count += token_count
+
+    # Close the last group, if there's anything left in it
+    if num_children > current_start:
+        boundaries.append(current_start)
+        group_token_counts.append(current_token_count)
+    boundaries.append(num_children)
+
+    return boundaries, group_token_counts
@@ -2,6 +2,7 @@
 import cython
 from cpython.list cimport PyList_New, PyList_Append
 from cpython.unicode cimport PyUnicode_Replace
+from libc.stdlib cimport malloc, free
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -63,7 +64,18 @@ def split_text(
         delimiters = [delim]
     else:
         delimiters = list(delim)
-    
+
+    # When no delimiter overlaps another, cut the text in a single scan over its characters.
+    # This splits exactly like the replace passes below, without rebuilding the text once per
+    # delimiter and splitting it again on the separator.
+    delimiters = list(dict.fromkeys(delimiters))
+    if delimiters and not _delimiters_overlap(delimiters):
+        splits = _split_at_delimiters(text, delimiters, include_delim)
+        if splits is None:
+            PyList_Append(segments, text)
+            return segments
+        return _merge_short_segments_fast(splits, min_characters_per_segment)
+
     # Use the efficient RecursiveChunker approach: keep delimiters, add separator
     if include_delim == "prev":
         # Add separator AFTER each delimiter (delimiter + sep)
@@ -96,6 +108,108 @@ def split_text(
     return _merge_short_segments_fast(splits, min_characters_per_segment)
 
 
+cdef bint _delimiters_overlap(list delimiters):
+    """
+    Check if any delimiter is empty, or overlaps another one.
+
+    Overlapping delimiters (e.g. ". " and ".") are cut in the order of the replace passes,
+    which a single left-to-right scan cannot reproduce.
+    """
+    cdef Py_ssize_t i, j, k
+    cdef str a, b
+    for i in range(len(delimiters)):
+        a = delimiters[i]
+        if not a:
+            return True
+        for j in range(i + 1, len(delimiters)):
+            b = delimiters[j]
+            if a in b or b in a:
+                return True
+            for k in range(1, min(len(a), len(b))):
+                if a.endswith(b[:k]) or b.endswith(a[:k]):
+                    return True
+    return False
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef list _split_at_delimiters(str text, list delimiters, str include_delim):
+    """
+    Cut the text at every delimiter in a single scan, keeping the delimiters as include_delim says.
+
+    Returns None if none of the delimiters is in the text.
+    """
+    cdef:
+        Py_ssize_t text_len = len(text)
+        Py_ssize_t num_delimiters = len(delimiters)
+        Py_ssize_t i = 0, start = 0, split_end, next_start
+        Py_ssize_t d, k, delimiter_len = 0
+        Py_UCS4 ch
+        Py_UCS4* first_chars
+        Py_ssize_t* lengths
+        str delimiter
+        bint matched
+        bint found_delim = False
+        int mode = 0 if include_delim == "prev" else (1 if include_delim == "next" else 2)
+        list splits = PyList_New(0)
+
+    first_chars = <Py_UCS4*>malloc(num_delimiters * sizeof(Py_UCS4))
+    lengths = <Py_ssize_t*>malloc(num_delimiters * sizeof(Py_ssize_t))
+    if first_chars is NULL or lengths is NULL:
+        free(first_chars)
+        free(lengths)
+        raise MemoryError("Failed to allocate memory for the delimiters")
+
+    try:
+        for d in range(num_delimiters):
+            delimiter = delimiters[d]
+            first_chars[d] = delimiter[0]
+            lengths[d] = len(delimiter)
+
+        while i < text_len:
+            ch = text[i]
+
+            # Only compare the whole delimiter when its first character matches
+            matched = False
+            for d in range(num_delimiters):
+                if ch != first_chars[d] or i + lengths[d] > text_len:
+                    continue
+                delimiter = delimiters[d]
+                delimiter_len = lengths[d]
+                matched = True
+                for k in range(1, delimiter_len):
+                    if text[i + k] != delimiter[k]:
+                        matched = False
+                        break
+                if matched:
+                    break
+            if not matched:
+                i += 1
+                continue
+
+            found_delim = True
+            if mode == 0:
+                split_end = next_start = i + delimiter_len
+            elif mode == 1:
+                split_end = next_start = i
+            else:
+                split_end = i
+                next_start = i + delimiter_len
+            if split_end > start:
+                PyList_Append(splits, text[start:split_end])
+            start = next_start
+            i += delimiter_len
+    finally:
+        free(first_chars)
+        free(lengths)
+
+    if not found_delim:
+        return None
+    if start < text_len:
+        PyList_Append(splits, text[start:text_len])
+    return splits
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef list _merge_short_segments_fast(list splits, int min_characters):
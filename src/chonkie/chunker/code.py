@@ -4,19 +4,32 @@ This module provides a CodeChunker class for splitting code into chunks of a spe
 
 """
 
+import threading
 import warnings
-from bisect import bisect_left
-from itertools import accumulate
-from typing import TYPE_CHECKING, Any, List, Literal, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, chain
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from tqdm import tqdm
 
 from chonkie.chunker.base import BaseChunker
 from chonkie.logger import get_logger
 from chonkie.pipeline import chunker
-from chonkie.tokenizer import TokenizerProtocol
+from chonkie.tokenizer import CharacterTokenizer, TokenizerProtocol
 from chonkie.types import Chunk
 
 logger = get_logger(__name__)
 
+# Import the optimized node grouping function
+try:
+    from .c_extensions.group import group_child_indices
+    GROUP_CYTHON_AVAILABLE = True
+except ImportError:
+    GROUP_CYTHON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from typing import Any
     try:
@@ -28,6 +41,63 @@ if TYPE_CHECKING:
             pass
 
 
+@lru_cache(maxsize=None)
+def _get_language(language: str) -> Any:
+    """Load the tree-sitter language once per process and cache it."""
+    from tree_sitter_language_pack import get_language
+    return get_language(language) # type: ignore
+
+
+def _get_parser(language: str) -> Any:
+    """Create a tree-sitter parser for the language using the cached language."""
+    from tree_sitter import Parser
+    return Parser(_get_language(language))
+
+
+# Tree-sitter parsers are not thread-safe, so every thread keeps its own parsers
+_thread_local = threading.local()
+
+
+def _get_thread_parser(language: str) -> Any:
+    """Get the tree-sitter parser for the language owned by the current thread."""
+    parsers: Optional[Dict[str, Any]] = getattr(_thread_local, "parsers", None)
+    if parsers is None:
+        parsers = _thread_local.parsers = {}
+    parser = parsers.get(language)
+    if parser is None:
+        parser = parsers[language] = _get_parser(language)
+    return parser
+
+
+def _walk_children(node: "Node") -> Tuple[List["Node"], List[int], List[int]]:
+    """Get the children of a node along with their byte spans, in a single cursor walk.
+
+    Walking with a `TreeCursor` visits each child once and reads its span right away,
+    instead of materializing `node.children` and going back through every child for
+    its `start_byte` and `end_byte`.
+    """
+    children: List["Node"] = []
+    start_bytes: List[int] = []
+    end_bytes: List[int] = []
+    cursor = node.walk()
+    if cursor.goto_first_child():
+        while True:
+            child = cursor.node
+            children.append(child)
+            start_bytes.append(child.start_byte)
+            end_bytes.append(child.end_byte)
+            if not cursor.goto_next_sibling():
+                break
+    return children, start_bytes, end_bytes
+
+
+@lru_cache(maxsize=None)
+def _get_magika() -> Any:
+    """Load the Magika model once per process and cache it."""
+    from magika import Magika
+    return Magika()
+
+
 @chunker("code")
 class CodeChunker(BaseChunker):
     """Chunker that recursively splits the code based on code context.
@@ -36,7 +106,7 @@ class CodeChunker(BaseChunker):
         tokenizer: The tokenizer to use.
         chunk_size: The size of the chunks to create.
         language: The language of the code to parse. Accepts any of the languages supported by tree-sitter-language-pack.
-        include_nodes: Whether to include the nodes in the returned chunks.
+        include_nodes: Has no effect, as the returned Chunks do not store the nodes. Kept for compatibility.
 
     """
 
@@ -51,7 +121,7 @@ class CodeChunker(BaseChunker):
             tokenizer: The tokenizer to use.
             chunk_size: The size of the chunks to create.
             language: The language of the code to parse. Accepts any of the languages supported by tree-sitter-language-pack.
-            include_nodes: Whether to include the nodes in the returned chunks.
+            include_nodes: Has no effect, as the returned Chunks do not store the nodes. Kept for compatibility.
 
         Raises:
             ImportError: If tree-sitter and tree-sitter-language-pack are not installed.
@@ -67,6 +137,13 @@ class CodeChunker(BaseChunker):
         # Initialize chunker-specific values
         self.chunk_size = chunk_size
         self.include_nodes = include_nodes
+        if include_nodes:
+            warnings.warn("`include_nodes` has no effect, as the returned Chunks do not store the tree-sitter nodes.")
+
+        # Per-document token state: the byte offset where each token of the document
+        # starts, and a fallback cache of token counts keyed by the tree-sitter node id
+        self._token_offsets: Optional[np.ndarray] = None
+        self._token_count_cache: Dict[int, int] = {}
 
         # TODO: Figure out a way to check if the language is supported by tree-sitter-language-pack
         #       Currently, we're just assuming that the language is supported.
@@ -83,12 +160,12 @@ class CodeChunker(BaseChunker):
                          "Consider setting the `language` parameter to a specific language to improve performance.")
 
             # Set the language to auto and initialize the Magika instance
-            self.magika = Magika() # type: ignore
+            self.magika = _get_magika()
             self.parser = None
         else:
-            self.parser = get_parser(language) # type: ignore
+            self.parser = _get_parser(language)
         
-        # Set the use_multiprocessing flag
+        # Set the use_multiprocessing flag, batches are parsed on a thread pool instead
         self._use_multiprocessing = False
 
     def _import_dependencies(self) -> None:
@@ -97,138 +174,236 @@ class CodeChunker(BaseChunker):
         try:
             # Set the global variables
             global Node, Parser, Tree
-            global get_parser, SupportedLanguage, Magika
+            global SupportedLanguage, Magika
 
             # Import the dependencies
             from magika import Magika
             from tree_sitter import Node, Parser, Tree
-            from tree_sitter_language_pack import SupportedLanguage, get_parser
+            from tree_sitter_language_pack import SupportedLanguage
         except ImportError:
             raise ImportError("One or more of the following dependencies are not installed: " +
                              "[ tree-sitter, tree-sitter-language-pack, magika ]" +
                              " Please install them using `pip install chonkie[code]`.")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state for pickling, without the tree-sitter parser and Magika instance."""
+        state = self.__dict__.copy()
+        state["parser"] = None
+        state.pop("magika", None)
+        state["_token_offsets"] = None
+        state["_token_count_cache"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state from pickling, re-creating the parser or Magika instance."""
+        self.__dict__.update(state)
+        self._import_dependencies()
+        if self.language == "auto":
+            self.magika = _get_magika()
+        else:
+            self.parser = _get_parser(self.language)
+
     def _detect_language(self, bytes_text: bytes) -> Any:
         """Detect the language of the code."""
         response = self.magika.identify_bytes(bytes_text)
         return response.output.label # type: ignore
 
-    def _merge_node_groups(self, node_groups: List[List["Node"]]) -> List["Node"]:
-        """Merge the node groups together."""
-        merged_node_group = []
-        for group in node_groups: 
-            merged_node_group.extend(group)
-        return merged_node_group
-        
-    def _group_child_nodes(self, node: "Node") -> Tuple[List[List["Node"]], List[int]]:
-        """Group the nodes together based on their token_counts."""
-        # Some edge cases to break the recursion
-        if len(node.children) == 0:
-            return ([], []) # TODO: Think more about this case!
-            
-        # Initialize the node groups and group token counts
-        node_groups = []
-        group_token_counts = []
+    def _get_token_byte_offsets(self, text: str, original_text_bytes: bytes) -> Optional[np.ndarray]:
+        """Tokenize the whole document once and return the byte offset where each token starts.
+
+        Returns None if the tokenizer cannot provide token offsets.
+        """
+        is_ascii = len(original_text_bytes) == len(text)
+        if isinstance(self.tokenizer.tokenizer, CharacterTokenizer):
+            # Every character is a token, so the offsets need no encoding of the text (which
+            # would also grow the vocabulary with every character of the document)
+            if is_ascii:
+                return np.arange(len(text), dtype=np.int64)
+            return self._get_char_to_byte(text)[:-1]
 
-        # Have a current group and a current token count to keep track
+        try:
+            _, offsets = self.tokenizer.encode_with_offsets(text)
+        except NotImplementedError:
+            return None
+
+        # The tokenizer offsets are character offsets, while the nodes use byte offsets
+        if isinstance(offsets, range):
+            char_offsets = np.arange(offsets.start, offsets.stop, offsets.step, dtype=np.int64)
+        else:
+            char_offsets = np.asarray(offsets, dtype=np.int64)
+        if is_ascii:
+            return char_offsets
+        return self._get_char_to_byte(text)[char_offsets]
+
+    @staticmethod
+    def _get_char_to_byte(text: str) -> np.ndarray:
+        """Map each character offset of the text, its end included, to its UTF-8 byte offset."""
+        # Map characters to bytes through the UTF-8 length of each code point
+        code_points = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        char_byte_lengths = 1 + (code_points >= 0x80) + (code_points >= 0x800) + (code_points >= 0x10000)
+        char_to_byte = np.zeros(len(text) + 1, dtype=np.int64)
+        np.cumsum(char_byte_lengths, out=char_to_byte[1:])
+        return char_to_byte
+
+    def _count_span_tokens(self, span_bounds: List[int]) -> List[int]:
+        """Count the document tokens starting in each span between consecutive span bounds.
+
+        The spans cover the whole text of the chunks, gaps between the nodes included, so the
+        tokens starting in the whitespace between two nodes are counted too.
+        """
+        # Search all the span bounds in the token offsets at once
+        return np.diff(np.searchsorted(self._token_offsets, span_bounds)).tolist()  # type: ignore[arg-type]
+
+    def _count_child_tokens(self,
+                            children: List["Node"],
+                            start_bytes: List[int],
+                            end_bytes: List[int],
+                            original_text_bytes: bytes) -> List[int]:
+        """Count the tokens for each of the children nodes, given their byte spans."""
+        # Count the tokens for all the uncached children in a single batched call.
+        # Zero-width nodes (e.g. MISSING nodes) have no tokens, so they never hit the tokenizer.
+        cache = self._token_count_cache
+        uncached = []
+        uncached_texts = []
+        for child, start_byte, end_byte in zip(children, start_bytes, end_bytes):
+            if child.id not in cache:
+                if start_byte == end_byte:
+                    cache[child.id] = 0
+                else:
+                    # Slice the source bytes directly instead of materializing `child.text` per node
+                    uncached.append(child)
+                    uncached_texts.append(original_text_bytes[start_byte:end_byte].decode("utf-8", errors="ignore"))
+        if uncached:
+            for child, count in zip(uncached, self.tokenizer.count_tokens_batch(uncached_texts)):
+                cache[child.id] = count
+        return [cache[child.id] for child in children]
+
+    def _group_child_indices(self, token_counts: List[int]) -> Tuple[List[int], List[int]]:
+        """Find the group boundaries for the children of a node from their token counts.
+
+        Python fallback for the Cython `group_child_indices`, used when the extension is not built.
+        """
+        boundaries: List[int] = []
+        group_token_counts: List[int] = []
+        current_start = 0
         current_token_count = 0
-        current_node_group: List["Node"] = []
-        for child in node.children:
-            child_text = child.text.decode() if child.text else ""
-            token_count: int = self.tokenizer.count_tokens(child_text)
-            # If the child itself is larger than chunk size then we need to split and group it
+        for i, token_count in enumerate(token_counts):
+            # A child larger than the chunk size goes into a group by itself, to be split later
             if token_count > self.chunk_size:
-                # Add whatever was there already
-                if current_node_group:
-                    node_groups.append(current_node_group)
+                if i > current_start:
+                    boundaries.append(current_start)
                     group_token_counts.append(current_token_count)
-
-                    current_node_group = []
-                    current_token_count = 0
-                    
-                # Recursively, add the child groups
-                child_groups, child_token_counts = self._group_child_nodes(child)
-                if child_groups:  # Only use recursive result if it produced groups
-                    node_groups.extend(child_groups)
-                    group_token_counts.extend(child_token_counts)
-                else:
-                    # Fallback: Add the current child as is if no recursive groups
-                    node_groups.append([child])
-                    group_token_counts.append(token_count)
-
-                # Reinit current stuff
-                current_node_group = []
+                boundaries.append(i)
+                group_token_counts.append(token_count)
+                current_start = i + 1
                 current_token_count = 0
-
             elif current_token_count + token_count > self.chunk_size:
-                # Add the current_node_group and token_count to the total
-                node_groups.append(current_node_group)
+                boundaries.append(current_start)
                 group_token_counts.append(current_token_count)
-
-                # Re-init the current_node_group and token_count
-                current_node_group = [child]
+                current_start = i
                 current_token_count = token_count
             else:
-                # Just add the child to the current_node_group
-                current_node_group.append(child)
                 current_token_count += token_count
 
-        # Finally, if there's something still in the current_node_group, 
-        # Add it as the last group
-        if current_node_group:
-            node_groups.append(current_node_group)
+        # Close the last group, if there's anything left in it
+        if len(token_counts) > current_start:
+            boundaries.append(current_start)
             group_token_counts.append(current_token_count)
+        boundaries.append(len(token_counts))
+        return boundaries, group_token_counts
 
+    def _group_child_nodes(self,
+                           node: "Node",
+                           original_text_bytes: bytes,
+                           span: Optional[Tuple[int, int]] = None) -> Tuple[List[List["Node"]], List[int]]:
+        """Group the nodes together based on their token_counts.
 
-        cumulative_group_token_counts = list(accumulate([0] + group_token_counts))
-        
+        The span is the byte range of the text that the node ends up in, from its start up to
+        the start of the node after it (the node's own byte range if not given).
+        """
+        # Some edge cases to break the recursion
+        if node.child_count == 0:
+            return ([], []) # TODO: Think more about this case!
+            
+        # Initialize the merged node groups and merged token counts
         merged_node_groups: List[List["Node"]] = [] # Explicit type hint
         merged_token_counts: List[int] = []      # Explicit type hint
-        pos = 0
-        while pos < len(node_groups):
-            # Calculate the target cumulative count based on the start of the current position
-            start_cumulative_count = cumulative_group_token_counts[pos]
-            # We want to find the end point 'index' such that the sum from pos to index-1 is <= chunk_size
-            # Or, cumulative[index] - cumulative[pos] should be <= chunk_size ideally,
-            # but bisect helps find the boundary where it *exceeds* it.
-            required_cumulative_target = start_cumulative_count + self.chunk_size
-
-            # Find the first index where the cumulative sum meets or exceeds the target
-            # Search only in the relevant part of the list: from pos + 1 onwards
-            # lo=pos ensures we handle the case where the group at 'pos' itself exceeds chunk_size
-            index = bisect_left(cumulative_group_token_counts, required_cumulative_target, lo=pos) - 1
-
-            # If the group at pos itself meets/exceeds the target, bisect_left returns pos.
-            # If bisect_left returns pos, it means the single group node_groups[pos]
-            # should form its own merged group. We need index to be at least pos + 1
-            # to form a valid slice node_groups[pos:index].
-            if index == pos:
-                 # Handle the case where the single group at pos is >= chunk_size
-                 # or if it's the very last group.
-                 index = pos + 1 # Take at least this one group
-
-            # Clamp index to be within the bounds of node_groups slicing
-            index = min(index, len(node_groups))
-
-            # Ensure we always make progress
-            if index <= pos:
-                # This might happen if cumulative_group_token_counts has issues or
-                # if bisect_left returns something unexpected. Force progress.
-                index = pos + 1
-
-            # Slice the original node_groups and merge them
-            groups_to_merge = node_groups[pos:index]
-            if not groups_to_merge:
-                # Should not happen if index is always > pos, but safety check
-                break
-            merged_node_groups.append(self._merge_node_groups(groups_to_merge))
 
-            # Calculate the token count for this merged group
-            actual_merged_count = cumulative_group_token_counts[index] - cumulative_group_token_counts[pos]
-            merged_token_counts.append(actual_merged_count)
+        # Have the groups pending to be merged together and their total token count.
+        # Groups are merged greedily as they are produced, flushing the merged group
+        # whenever adding the next group would reach the chunk_size. Every merged group
+        # takes at least one group, to always make progress.
+        pending_groups: List[List["Node"]] = []
+        pending_token_count = 0
+
+        def add_group(group: List["Node"], group_token_count: int) -> None:
+            nonlocal pending_groups, pending_token_count
+            if pending_groups and pending_token_count + group_token_count >= self.chunk_size:
+                merged_node_groups.append(list(chain.from_iterable(pending_groups)))
+                merged_token_counts.append(pending_token_count)
+                pending_groups = []
+                pending_token_count = 0
+            pending_groups.append(group)
+            pending_token_count += group_token_count
+
+        children, start_bytes, end_bytes = _walk_children(node)
+
+        # Like the chunk texts, each child spans from its start up to the start of the next
+        # child, and the last child up to the end of the node's span
+        span_start, span_end = span if span is not None else (node.start_byte, node.end_byte)
+        span_bounds = [span_start] + start_bytes[1:] + [span_end]
+
+        # If the document was tokenized upfront, count the tokens starting in each child span.
+        # Otherwise, count the tokens of the children themselves with the tokenizer.
+        if self._token_offsets is not None:
+            token_counts = self._count_span_tokens(span_bounds)
+        else:
+            token_counts = self._count_child_tokens(children, start_bytes, end_bytes, original_text_bytes)
+
+        # Without token offsets, pre-count the children of all the oversized children in one
+        # batched call, so that the recursive calls below are served from the token count cache
+        if self._token_offsets is None:
+            grandchildren: List["Node"] = []
+            grandchild_start_bytes: List[int] = []
+            grandchild_end_bytes: List[int] = []
+            for child, token_count in zip(children, token_counts):
+                if token_count > self.chunk_size:
+                    nodes, starts, ends = _walk_children(child)
+                    grandchildren.extend(nodes)
+                    grandchild_start_bytes.extend(starts)
+                    grandchild_end_bytes.extend(ends)
+            if grandchildren:
+                self._count_child_tokens(grandchildren, grandchild_start_bytes, grandchild_end_bytes,
+                                         original_text_bytes)
+
+        # Group the children based on their token counts alone
+        if GROUP_CYTHON_AVAILABLE:
+            boundaries, group_token_counts = group_child_indices(token_counts, self.chunk_size)
+        else:
+            boundaries, group_token_counts = self._group_child_indices(token_counts)
+
+        for i, group_token_count in enumerate(group_token_counts):
+            start, end = boundaries[i], boundaries[i + 1]
+            # If the child itself is larger than chunk size then we need to split and group it
+            if group_token_count > self.chunk_size:
+                child = children[start]
+                # Recursively, add the child groups
+                child_groups, child_token_counts = self._group_child_nodes(
+                    child, original_text_bytes, (span_bounds[start], span_bounds[start + 1])
+                )
+                if child_groups:  # Only use recursive result if it produced groups
+                    for child_group, child_token_count in zip(child_groups, child_token_counts):
+                        add_group(child_group, child_token_count)
+                else:
+                    # Fallback: Add the current child as is if no recursive groups
+                    add_group([child], group_token_count)
+            else:
+                add_group(children[start:end], group_token_count)
 
-            # Move the position marker to the start of the next potential merged group
-            pos = index
+        # Finally, flush the pending groups as the last merged group
+        if pending_groups:
+            merged_node_groups.append(list(chain.from_iterable(pending_groups)))
+            merged_token_counts.append(pending_token_count)
 
         return (merged_node_groups, merged_token_counts)
 
@@ -250,74 +425,46 @@ class CodeChunker(BaseChunker):
             of the corresponding node group.
 
         """
-        chunk_texts: List[str] = []
         if not original_text_bytes:
             return [] # Return empty list if original text was empty
 
-        for i, group in enumerate(node_groups):
+        # Validate the byte offsets of all the groups once upfront
+        text_length = len(original_text_bytes)
+        valid_groups: List[List["Node"]] = []
+        for group in node_groups:
             if not group:
                 # Skip if an empty group was somehow generated
                 continue
-
-            # Determine the start byte of the first node in the group
-            start_node = group[0]
-            start_byte = start_node.start_byte
-
-            # Determine the end byte of the last node in the group
-            end_node = group[-1]
-            end_byte = end_node.end_byte
-
-            # Basic validation for byte offsets
+            start_byte, end_byte = group[0].start_byte, group[-1].end_byte
             if start_byte > end_byte:
                 warnings.warn(f"Warning: Skipping group due to invalid byte order. Start: {start_byte}, End: {end_byte}")
                 continue
-            if start_byte < 0 or end_byte > len(original_text_bytes):
-                 warnings.warn(f"Warning: Skipping group due to out-of-bounds byte offsets. Start: {start_byte}, End: {end_byte}, Text Length: {len(original_text_bytes)}")
-                 continue
-                
-            # Add the gap bytes if this is not the last node_group
-            if i < len(node_groups)-1:
-                end_byte = node_groups[i+1][0].start_byte
-
-            # Extract the slice from the original bytes
-            chunk_bytes = original_text_bytes[start_byte:end_byte]
-
-            # Decode the bytes into a string
-            try:
-                text = chunk_bytes.decode("utf-8", errors="ignore") # Or 'replace'
-                chunk_texts.append(text)
-            except Exception as e:
-                warnings.warn(f"Warning: Error decoding bytes for chunk ({start_byte}-{end_byte}): {e}")
-                # Append an empty string or placeholder if decoding fails
-                chunk_texts.append("")                
-
-        # Post-processing to add any missing bytes between the node_groups and the original_text_bytes
-        # If the starting point of the first node group doesn't start with 0, add the initial bytes
-        if node_groups[0][0].start_byte != 0:
-            chunk_texts[0] = original_text_bytes[:node_groups[0][0].start_byte].decode("utf-8", errors="ignore") + chunk_texts[0]
-        # If the ending point of the last node group doesn't match with last point of the original_text_bytes, add the remaining bytes
-        if node_groups[-1][-1].end_byte != len(original_text_bytes):
-            chunk_texts[-1] = chunk_texts[-1] + original_text_bytes[node_groups[-1][-1].end_byte:].decode("utf-8", errors="ignore")
-            
-        return chunk_texts
+            if start_byte < 0 or end_byte > text_length:
+                warnings.warn(f"Warning: Skipping group due to out-of-bounds byte offsets. Start: {start_byte}, End: {end_byte}, Text Length: {text_length}")
+                continue
+            valid_groups.append(group)
+        if not valid_groups:
+            return []
+
+        # Each group spans from its own start to the start of the next group, so the gap bytes
+        # are kept. The outer boundaries cover any bytes before the first or after the last group.
+        boundaries = [0] + [group[0].start_byte for group in valid_groups[1:]] + [text_length]
+
+        # Slice a memoryview over the original bytes, so no intermediate bytes are copied
+        original_text_view = memoryview(original_text_bytes)
+        return [str(original_text_view[boundaries[i]:boundaries[i + 1]], "utf-8", "ignore")
+                for i in range(len(valid_groups))]
 
-    def _create_chunks(self,
-                       texts: List[str],
-                       token_counts: List[int],
-                       node_groups: List[List["Node"]]) -> List[Chunk]:
+    def _create_chunks(self, texts: List[str], token_counts: List[int]) -> List[Chunk]:
         """Create Code Chunks."""
-        chunks = []
-        current_index = 0
-        for i in range(len(texts)):
-            text = texts[i]
-            token_count = token_counts[i]
-
-            chunks.append(Chunk(text=text,
-                                start_index=current_index,
-                                end_index=current_index + len(text),
-                                token_count=token_count))  # type: ignore[attr-defined]
-            current_index += len(text)
-        return chunks
+        # Compute all the chunk offsets at once from the cumulative text lengths
+        text_lengths = [len(text) for text in texts]
+        start_indices = accumulate(text_lengths, initial=0)
+        return [Chunk(text=text,
+                      start_index=start_index,
+                      end_index=start_index + text_length,
+                      token_count=token_count)  # type: ignore[attr-defined]
+                for text, text_length, start_index, token_count in zip(texts, text_lengths, start_indices, token_counts)]
         
     def chunk(self, text: str) -> List[Chunk]:
         """Recursively chunks the code based on context from tree-sitter."""
@@ -334,28 +481,97 @@ class CodeChunker(BaseChunker):
         if self.language == "auto":
             language = self._detect_language(original_text_bytes)
             logger.info(f"Auto-detected code language: {language}")
-            self.parser = get_parser(language) # type: ignore
+            self.parser = _get_parser(language)
         else:
             logger.debug(f"Using configured language: {self.language}")
 
+        # Create the parsing tree for the current code
+        tree: Tree = self.parser.parse(original_text_bytes) # type: ignore
+        return self._chunk_tree(text, original_text_bytes, tree)
+
+    def _chunk_tree(self, text: str, original_text_bytes: bytes, tree: "Tree") -> List[Chunk]:
+        """Chunk the code using its already parsed tree-sitter tree."""
         try:
-            # Create the parsing tree for the current code
-            tree: Tree = self.parser.parse(original_text_bytes) # type: ignore
             root_node: Node = tree.root_node # type: ignore
 
-            # Get the node_groups 
-            node_groups, token_counts = self._group_child_nodes(root_node)
+            # Reset the token state for this document before grouping the nodes
+            self._token_offsets = self._get_token_byte_offsets(text, original_text_bytes)
+            self._token_count_cache = {}
+            node_groups, token_counts = self._group_child_nodes(root_node, original_text_bytes,
+                                                                (0, len(original_text_bytes)))
             texts: List[str] = self._get_texts_from_node_groups(node_groups, original_text_bytes)
-        finally: 
-            # Clean up the tree and root_node if they are not needed
-            if not self.include_nodes:
-                del tree, root_node
-                node_groups = []
-
-        chunks = self._create_chunks(texts, token_counts, node_groups)
+        finally:
+            # Release the per-document token state, so the chunker keeps nothing of the
+            # document alive once its chunks are built
+            self._token_offsets = None
+            self._token_count_cache = {}
+
+        # The chunks only carry their text and offsets, not the tree-sitter nodes, so the
+        # node groups (and the tree they keep alive) can be released before building them
+        del node_groups, root_node, tree
+        chunks = self._create_chunks(texts, token_counts)
         logger.info(f"Created {len(chunks)} code chunks from parsed syntax tree")
         return chunks 
-        
+
+    def _parse_text(self, text: str) -> Optional[Tuple[bytes, "Tree"]]:
+        """Parse the code with a parser owned by the current thread.
+
+        Returns None for empty or whitespace-only code.
+        """
+        if not text.strip():
+            return None
+        original_text_bytes = text.encode("utf-8")
+        if self.language == "auto":
+            language = self._detect_language(original_text_bytes)
+        else:
+            language = self.language
+        return original_text_bytes, _get_thread_parser(language).parse(original_text_bytes)
+
+    def chunk_batch(self, texts: Sequence[str], show_progress: bool = True) -> List[List[Chunk]]:
+        """Chunk a batch of code texts, parsing them concurrently on a thread pool.
+
+        Tree-sitter parses outside of the GIL, so the texts are parsed on threads rather than
+        worker processes, which avoids pickling the chunker and the chunks for every text.
+
+        Args:
+            texts (Sequence[str]): The code texts to chunk.
+            show_progress (bool): Whether to show progress.
+
+        Returns:
+            List[List[Chunk]]: A list of lists of Chunks.
+
+        """
+        if len(texts) == 0:
+            return []
+
+        num_workers = self._get_optimal_worker_count()
+        logger.info(f"Parsing batch of {len(texts)} texts", workers=num_workers)
+        results: List[List[Chunk]] = []
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # Keep only a window of num_workers texts parsing ahead of the one being chunked,
+            # so that the trees of the whole batch are never alive at once
+            parsing: Deque["Future[Optional[Tuple[bytes, Tree]]]"] = deque(
+                executor.submit(self._parse_text, text) for text in texts[:num_workers]
+            )
+            for i, text in enumerate(
+                tqdm(
+                    texts,
+                    desc="🦛",
+                    disable=not show_progress,
+                    unit="doc",
+                    bar_format="{desc} ch{bar:20}nk {percentage:3.0f}% • {n_fmt}/{total_fmt} docs chunked [{elapsed}<{remaining}, {rate_fmt}] 🌱",
+                    ascii=" o",
+                )
+            ):
+                parsed_text = parsing.popleft().result()
+                if i + num_workers < len(texts):
+                    parsing.append(executor.submit(self._parse_text, texts[i + num_workers]))
+                if parsed_text is None:
+                    results.append([])
+                else:
+                    results.append(self._chunk_tree(text, *parsed_text))
+        return results
+
     def __repr__(self) -> str:
         """Return the string representation of the CodeChunker."""
         return (f"CodeChunker(tokenizer={self.tokenizer},"
@@ -6,10 +6,13 @@ specified token count limits for each chunk. It also handles overlapping chunks
 allows customization of sentence boundary delimiters and minimum sentence lengths.
 """
 
+import copy
+import re
 import warnings
 from bisect import bisect_left
-from itertools import accumulate
-from typing import List, Literal, Optional, Sequence, Union
+from functools import lru_cache
+from itertools import accumulate, islice
+from typing import Dict, List, Literal, Optional, Union
 
 from chonkie.logger import get_logger
 from chonkie.pipeline import chunker
@@ -21,13 +24,6 @@ from .base import BaseChunker
 
 logger = get_logger(__name__)
 
-# Import optimized merge functions
-try:
-    from .c_extensions.merge import find_merge_indices
-    MERGE_CYTHON_AVAILABLE = True
-except ImportError:
-    MERGE_CYTHON_AVAILABLE = False
-
 # Import the unified split function
 try:
     from .c_extensions.split import split_text
@@ -36,6 +32,35 @@ except ImportError:
     SPLIT_AVAILABLE = False
 
 
+def _compile_delimiters(delim: Union[str, List[str]]) -> Optional["re.Pattern[str]"]:
+    """Compile the delimiters into a single pattern matching any of them.
+
+    Scanning for the leftmost match cuts the text like replacing every delimiter in turn,
+    as long as no delimiter overlaps another one. Returns None when some delimiters overlap
+    (or are empty), since then the order of the replace passes decides where the cuts are,
+    and when there are no delimiters at all, since an empty pattern would cut everywhere.
+    The pattern captures the delimiters, so that `split` keeps them in its result.
+    """
+    delimiters = list(dict.fromkeys(delim))
+    if not delimiters:
+        return None
+    for i, a in enumerate(delimiters):
+        if not a:
+            return None
+        for b in delimiters[i + 1:]:
+            if a in b or b in a:
+                return None
+            if any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b)))):
+                return None
+    return re.compile("(" + "|".join(re.escape(d) for d in delimiters) + ")")
+
+
+@lru_cache(maxsize=32)
+def _get_hub_recipe(name: Optional[str], lang: Optional[str]) -> Dict:
+    """Get the recipe from the hub once per process and cache it, as every lookup goes to the hub."""
+    return Hubbie().get_recipe(name, lang)
+
+
 @chunker("sentence")
 class SentenceChunker(BaseChunker):
     """SentenceChunker splits the sentences in a text based on token limits and sentence boundaries.
@@ -111,6 +136,19 @@ class SentenceChunker(BaseChunker):
         self.include_delim = include_delim
         self.sep = "✄"
 
+        # Precompile the delimiters for the Python fallback of `_split_text`
+        self._delim_pattern = _compile_delimiters(delim)
+
+        # Token counts of the sentences seen so far, keyed by the sentence text, so that
+        # repeated sentences (headers, footers, quoted lines) skip the tokenizer. The oldest
+        # entries are evicted first once the cache holds more than _cache_size sentences.
+        self._cache_size = 8192
+        self._token_count_cache: Dict[str, int] = {}
+
+    def clear_cache(self) -> None:
+        """Clear the sentence token count cache to free memory."""
+        self._token_count_cache.clear()
+
     @classmethod
     def from_recipe(cls,
         name: Optional[str] = "default",
@@ -147,10 +185,14 @@ class SentenceChunker(BaseChunker):
             ValueError: If the recipe is invalid.
 
         """
-        # Create a hubbie instance
-        hub = Hubbie()
+        # Get the recipe, from the cache if it was downloaded before. Recipes from a path are
+        # read every time, so that edits to the file are picked up. The cached recipe is copied,
+        # so that no two chunkers share (and mutate) the same delimiter list.
         logger.info("Loading SentenceChunker recipe", name=name, lang=lang)
-        recipe = hub.get_recipe(name, lang, path)
+        if path is None:
+            recipe = copy.deepcopy(_get_hub_recipe(name, lang))
+        else:
+            recipe = Hubbie().get_recipe(name, lang, path)
         logger.debug("Recipe loaded successfully", delim=recipe.get("delim"), include_delim=recipe.get("include_delim"))
         return cls(
             tokenizer=tokenizer,
@@ -187,35 +229,55 @@ class SentenceChunker(BaseChunker):
             ))
         else:
             # Fallback to original Python implementation
-            t = text
-            for c in self.delim:
+            if self._delim_pattern is not None:
+                # Cut the text at every delimiter in a single scan of the precompiled pattern.
+                # The split alternates the texts between the delimiters and the delimiters
+                # themselves, which are glued back to the previous or next text.
+                parts = self._delim_pattern.split(text)
+                if len(parts) == 1:
+                    # Without any delimiter, the whole text is a single sentence
+                    return [text] if text else []
+                texts, delimiters = parts[::2], parts[1::2]
                 if self.include_delim == "prev":
-                    t = t.replace(c, c + self.sep)
+                    splits = [t + d for t, d in zip(texts, delimiters)]
+                    splits.append(texts[-1])
                 elif self.include_delim == "next":
-                    t = t.replace(c, self.sep + c)
+                    splits = [texts[0]]
+                    splits.extend([d + t for d, t in zip(delimiters, texts[1:])])
                 else:
-                    t = t.replace(c, self.sep)
+                    splits = texts
+            else:
+                # Overlapping delimiters are replaced in turn, skipping the replace pass
+                # for the delimiters that are not in the text
+                t = text
+                found_delim = False
+                for c in self.delim:
+                    if c not in t:
+                        continue
+                    found_delim = True
+                    if self.include_delim == "prev":
+                        t = t.replace(c, c + self.sep)
+                    elif self.include_delim == "next":
+                        t = t.replace(c, self.sep + c)
+                    else:
+                        t = t.replace(c, self.sep)
 
-            # Initial split
-            splits = [s for s in t.split(self.sep) if s != ""]
+                # Without any delimiter, the whole text is a single sentence
+                if not found_delim:
+                    return [text] if text else []
+                splits = t.split(self.sep)
 
-            # Combine short splits with previous sentence
+            # Combine short splits with the next ones until they make a sentence, skipping
+            # the empty splits between adjacent delimiters. A split that is long enough on
+            # its own is a sentence as is, without being concatenated to anything.
+            min_characters_per_sentence = self.min_characters_per_sentence
             current = ""
             sentences = []
             for s in splits:
-                # If the split is short, add to current and if long add to sentences
-                if len(s) < self.min_characters_per_sentence:
-                    current += s
-                elif current:
-                    current += s
-                    sentences.append(current)
-                    current = ""
-                else:
-                    sentences.append(s)
-
-                # At any point if the current sentence is longer than the min_characters_per_sentence,
-                # add it to the sentences
-                if len(current) >= self.min_characters_per_sentence:
+                if not s:
+                    continue
+                current = current + s if current else s
+                if len(current) >= min_characters_per_sentence:
                     sentences.append(current)
                     current = ""
 
@@ -225,6 +287,28 @@ class SentenceChunker(BaseChunker):
 
             return sentences
 
+    def _count_sentence_tokens(self, sentence_texts: List[str]) -> List[int]:
+        """Count the tokens of each sentence, in a single batch for the uncached sentences.
+
+        Args:
+            sentence_texts: List of sentence texts to count the tokens of
+
+        Returns:
+            List of token counts, one per sentence
+
+        """
+        # Only the sentences that are not in the token count cache yet hit the tokenizer
+        cache = self._token_count_cache
+        misses = list(dict.fromkeys(sent for sent in sentence_texts if sent not in cache))
+        if misses:
+            for sent, count in zip(misses, self.tokenizer.count_tokens_batch(misses)):
+                cache[sent] = count
+        token_counts = [cache[sent] for sent in sentence_texts]
+        if len(cache) > self._cache_size:
+            for sent in list(islice(cache, len(cache) - self._cache_size)):
+                del cache[sent]
+        return token_counts
+
     def _prepare_sentences(self, text: str) -> List[Sentence]:
         """Split text into sentences and calculate token counts for each sentence.
 
@@ -240,41 +324,33 @@ class SentenceChunker(BaseChunker):
         if not sentence_texts:
             return []
 
-        # Calculate positions once
-        positions = []
+        # Get accurate token counts in batch (this is faster than estimating)
+        token_counts = self._count_sentence_tokens(sentence_texts)
+
+        # Create sentence objects, computing their positions in the same pass.
+        # No +1 space because sentences are already separated by spaces
+        sentences: List[Sentence] = []
+        append = sentences.append
+        sentence_cls = Sentence  # Local lookup in the loop
         current_pos = 0
-        for sent in sentence_texts:
-            positions.append(current_pos)
-            current_pos += len(
-                sent
-            )  # No +1 space because sentences are already separated by spaces
+        for sent, count in zip(sentence_texts, token_counts):
+            end_pos = current_pos + len(sent)
+            append(sentence_cls(text=sent, start_index=current_pos, end_index=end_pos, token_count=count))
+            current_pos = end_pos
+        return sentences
 
-        # Get accurate token counts in batch (this is faster than estimating)
-        token_counts: Sequence[int] = self.tokenizer.count_tokens_batch(sentence_texts)
-
-        # Create sentence objects
-        return [
-            Sentence(
-                text=sent,
-                start_index=pos,
-                end_index=pos + len(sent),
-                token_count=count,
-            )
-            for sent, pos, count in zip(sentence_texts, positions, token_counts)
-        ]
-
-    def _create_chunk(self, sentences: List[Sentence]) -> Chunk:
-        """Create a chunk from a list of sentences.
+    def _create_chunk(self, chunk_text: str, start_index: int, end_index: int) -> Chunk:
+        """Create a chunk from the text of a run of consecutive sentences.
 
         Args:
-            sentences: List of sentences to create chunk from
+            chunk_text: Text of the sentences in the chunk
+            start_index: Start index of the first sentence in the original text
+            end_index: End index of the last sentence in the original text
 
         Returns:
             Chunk object
 
         """
-        chunk_text = "".join([sentence.text for sentence in sentences])
-
         # We calculate the token count here, as sum of the token counts of the sentences
         # does not match the token count of the chunk as a whole for some reason. That's to
         # say that the tokenizer encodes the text differently when the text is joined together.
@@ -282,8 +358,8 @@ class SentenceChunker(BaseChunker):
 
         return Chunk(
             text=chunk_text,
-            start_index=sentences[0].start_index,
-            end_index=sentences[-1].end_index,
+            start_index=start_index,
+            end_index=end_index,
             token_count=token_count,
         )
 
@@ -303,83 +379,88 @@ class SentenceChunker(BaseChunker):
 
         logger.debug(f"Chunking text of length {len(text)}")
 
-        # Get prepared sentences with token counts
-        sentences = self._prepare_sentences(text)  # 28mus
-        if not sentences:
+        # A text that fits in a single chunk is returned whole, without splitting it into
+        # sentences and counting them. Tokenizers rarely make more tokens than characters, so
+        # only the texts no longer than chunk_size are worth counting as a whole first. Like
+        # the split points below, the text fits when it stays under chunk_size.
+        if len(text) <= self.chunk_size and self.include_delim is not None and self.min_sentences_per_chunk == 1:
+            token_count = self.tokenizer.count_tokens(text)
+            if token_count < self.chunk_size:
+                logger.info("Created 1 chunk from text", text_length=len(text))
+                return [Chunk(text=text, start_index=0, end_index=len(text), token_count=token_count)]
+
+        # Split the text into sentences and count their tokens. The chunks only need the
+        # sentence texts, token counts and offsets, so no Sentence objects are built here.
+        sentence_texts = self._split_text(text)
+        if not sentence_texts:
             logger.debug("No sentences extracted from text")
             return []
+        token_counts = self._count_sentence_tokens(sentence_texts)
+        num_sentences = len(sentence_texts)
 
-        logger.debug(f"Prepared {len(sentences)} sentences for chunking")
+        logger.debug(f"Prepared {num_sentences} sentences for chunking")
 
-        # Pre-calculate cumulative token counts for bisect
-        token_sums = list(
-            accumulate(
-                [s.token_count for s in sentences],
-                lambda a, b: a + b,
-                initial=0,
-            )
-        )
+        # Pre-calculate the sentence offsets, and the cumulative token counts for bisect.
+        # No +1 space because sentences are already separated by spaces
+        offsets = list(accumulate(map(len, sentence_texts), initial=0))
+        token_sums = list(accumulate(token_counts, initial=0))
+
+        # The overlap counts every sentence with +1 for the space, so it has its own
+        # cumulative counts for bisect
+        overlap_sums = list(accumulate((count + 1 for count in token_counts), initial=0)) if self.chunk_overlap > 0 else []
+
+        # Bind the settings and methods used on every chunk to locals for the loop
+        chunk_size = self.chunk_size
+        chunk_overlap = self.chunk_overlap
+        min_sentences_per_chunk = self.min_sentences_per_chunk
+        create_chunk = self._create_chunk
 
-        chunks = []
+        # The sentences keep their delimiters unless include_delim is None, and then they
+        # tile the text, so a chunk is a single slice of it instead of a join of its sentences
+        contiguous = self.include_delim is not None
+
+        chunks: List[Chunk] = []
+        append = chunks.append
         pos = 0
 
-        while pos < len(sentences):
-            # OPTIMIZATION: Use Cython for single bisect operation when available
-            if MERGE_CYTHON_AVAILABLE:
-                # Create a subset view for the Cython function to work on
-                remaining_token_counts = [s.token_count for s in sentences[pos:]]
-                if remaining_token_counts:
-                    merge_indices = find_merge_indices(remaining_token_counts, self.chunk_size, 0)
-                    if merge_indices:
-                        split_idx = pos + merge_indices[0]
-                    else:
-                        split_idx = len(sentences)
-                else:
-                    split_idx = len(sentences)
-            else:
-                # Use bisect_left to find initial split point (fallback)
-                target_tokens = token_sums[pos] + self.chunk_size
-                split_idx = bisect_left(token_sums, target_tokens) - 1
-                split_idx = min(split_idx, len(sentences))
+        while pos < num_sentences:
+            # Use bisect_left on the cumulative token counts to find the initial split point.
+            # A single binary search per chunk, instead of finding the merge indices of all
+            # the remaining sentences and keeping only the first one. The split index never
+            # goes past num_sentences, since token_sums has num_sentences + 1 entries.
+            split_idx = bisect_left(token_sums, token_sums[pos] + chunk_size, pos) - 1
 
-                # Ensure we include at least one sentence beyond pos
-                split_idx = max(split_idx, pos + 1)
+            # Ensure we include at least one sentence beyond pos
+            if split_idx <= pos:
+                split_idx = pos + 1
 
             # Handle minimum sentences requirement
-            if split_idx - pos < self.min_sentences_per_chunk:
+            if split_idx - pos < min_sentences_per_chunk:
                 # If the minimum sentences per chunk can be met, set the split index to the minimum sentences per chunk
                 # Otherwise, warn the user that the minimum sentences per chunk could not be met for all chunks
-                if pos + self.min_sentences_per_chunk <= len(sentences):
-                    split_idx = pos + self.min_sentences_per_chunk
+                if pos + min_sentences_per_chunk <= num_sentences:
+                    split_idx = pos + min_sentences_per_chunk
                 else:
                     warnings.warn(
-                        f"Minimum sentences per chunk as {self.min_sentences_per_chunk} could not be met for all chunks. "
-                        + f"Last chunk of the text will have only {len(sentences) - pos} sentences. "
+                        f"Minimum sentences per chunk as {min_sentences_per_chunk} could not be met for all chunks. "
+                        + f"Last chunk of the text will have only {num_sentences - pos} sentences. "
                         + "Consider increasing the chunk_size or decreasing the min_sentences_per_chunk."
                     )
-                    split_idx = len(sentences)
+                    split_idx = num_sentences
 
             # Get candidate sentences and verify actual token count
-            chunk_sentences = sentences[pos:split_idx]
-            chunks.append(self._create_chunk(chunk_sentences))
+            start_index, end_index = offsets[pos], offsets[split_idx]
+            chunk_text = text[start_index:end_index] if contiguous else "".join(sentence_texts[pos:split_idx])
+            append(create_chunk(chunk_text, start_index, end_index))
 
             # TODO: This would also get deprecated when we have OverlapRefinery in the future.
             # Calculate next position with overlap
-            if self.chunk_overlap > 0 and split_idx < len(sentences):
-                # Calculate how many sentences we need for overlap
-                overlap_tokens = 0
-                overlap_idx = split_idx - 1
-
-                while overlap_idx > pos and overlap_tokens < self.chunk_overlap:
-                    sent = sentences[overlap_idx]
-                    next_tokens = overlap_tokens + sent.token_count + 1  # +1 for space
-                    if next_tokens > self.chunk_overlap:
-                        break
-                    overlap_tokens = next_tokens
-                    overlap_idx -= 1
-
-                # Move position to after the overlap
-                pos = overlap_idx + 1
+            if chunk_overlap > 0 and split_idx < num_sentences:
+                # The overlap is the longest run of sentences ending at split_idx that fits
+                # in chunk_overlap, found with bisect_left on the overlap cumulative counts.
+                # The next chunk still starts at least one sentence after pos.
+                overlap_start = bisect_left(overlap_sums, overlap_sums[split_idx] - chunk_overlap, pos, split_idx)
+                pos = overlap_start if overlap_start > pos else pos + 1
             else:
                 pos = split_idx
 
@@ -3,8 +3,6 @@
 import os
 from typing import Any, Dict, List, Literal, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
@@ -36,6 +34,8 @@ class CodeChunker(CloudChunker):
             ValueError: If the API key is not provided or if parameters are invalid.
 
         """
+        import requests
+
         # If no API key is provided, use the environment variable
         self.api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not self.api_key:
@@ -79,6 +79,8 @@ class CodeChunker(CloudChunker):
             ValueError: If the API request fails or returns invalid data.
 
         """
+        import requests
+
         # Define the payload for the request
         payload: Dict[str, Any]
         if text is not None:
@@ -2,8 +2,6 @@
 
 from typing import Any, Dict, List, Optional, Union, cast
 
-import requests
-
 from chonkie.types import Chunk
 
 from .recursive import RecursiveChunker
@@ -59,6 +57,8 @@ class LateChunker(RecursiveChunker):
             ValueError: If the API returns an error or an invalid response.
 
         """
+        import requests
+
         # Make the payload
         payload: Dict[str, Any]
         if text is not None:
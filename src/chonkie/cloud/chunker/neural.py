@@ -3,8 +3,6 @@
 import os
 from typing import Any, Dict, List, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
@@ -31,6 +29,8 @@ class NeuralChunker(CloudChunker):
         api_key: Optional[str] = None,
     ) -> None:
         """Initialize the NeuralChunker."""
+        import requests
+
         self.api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not self.api_key:
             raise ValueError(
@@ -69,6 +69,8 @@ class NeuralChunker(CloudChunker):
         self, text: Optional[Union[str, List[str]]] = None, file: Optional[str] = None
     ) -> Union[List[Chunk], List[List[Chunk]]]:
         """Chunk the text or file into a list of chunks."""
+        import requests
+
         # Create the payload
         payload: Dict[str, Any]
         if text is not None:
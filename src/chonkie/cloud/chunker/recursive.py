@@ -3,8 +3,6 @@
 import os
 from typing import Any, Dict, List, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
@@ -37,6 +35,8 @@ class RecursiveChunker(CloudChunker):
             api_key: The Chonkie API key. If None, it's read from the CHONKIE_API_KEY environment variable.
 
         """
+        import requests
+
         # If no API key is provided, use the environment variable
         self.api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not self.api_key:
@@ -72,6 +72,8 @@ class RecursiveChunker(CloudChunker):
 
     def chunk(self, text: Optional[Union[str, List[str]]] = None, file: Optional[str] = None) -> Any:
         """Chunk the text or file into a list of chunks."""
+        import requests
+
         # Make the payload
         payload: Dict[str, Any]
         if text is not None:
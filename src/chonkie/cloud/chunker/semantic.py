@@ -3,8 +3,6 @@
 import os
 from typing import Any, Dict, List, Literal, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
@@ -34,6 +32,8 @@ class SemanticChunker(CloudChunker):
         api_key: Optional[str] = None,
     ) -> None:
         """Initialize the Chonkie Cloud Semantic Chunker."""
+        import requests
+
         super().__init__()
         
         # Get the API key
@@ -119,6 +119,8 @@ class SemanticChunker(CloudChunker):
 
     def chunk(self, text: Optional[Union[str, List[str]]] = None, file: Optional[str] = None) -> Union[List[Chunk], List[List[Chunk]]]:
         """Chunk the text or file into a list of chunks."""
+        import requests
+
         # Make the payload
         payload: Dict[str, Any]
         if text is not None:
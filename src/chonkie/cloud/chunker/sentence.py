@@ -3,13 +3,18 @@
 import os
 from typing import Any, Dict, List, Literal, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
 from .base import CloudChunker
 
+# orjson (de)serializes long texts several times faster than the stdlib json used by requests
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class SentenceChunker(CloudChunker):
     """Sentence Chunking for Chonkie API."""
@@ -62,20 +67,22 @@ class SentenceChunker(CloudChunker):
         self.delim = delim
         self.include_delim = include_delim
 
-        # Check if the API is up right now
-        response = requests.get(f"{self.BASE_URL}/")
-        if response.status_code != 200:
-            raise ValueError(
-                "Oh no! You caught Chonkie at a bad time. It seems to be down right now."
-                + "Please try again in a short while."
-                + "If the issue persists, please contact support at support@chonkie.ai or raise an issue on GitHub."
-            )
+        # Reuse the connection to the API across chunk calls. There is no upfront check
+        # that the API is up, a failing request already says so on the first chunk call.
+        # Connections that drop before the request is sent are retried on the same pool.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.1)))
 
         # Initialize the file manager to upload files if needed
         self.file_manager = FileManager(api_key=self.api_key)
 
     def chunk(self, text: Optional[Union[str, List[str]]] = None, file: Optional[str] = None) -> Union[List[Chunk], List[List[Chunk]]]:
         """Chunk the text or file via sentence boundaries."""
+        import requests
+
         # Define the payload for the request
         payload: Dict[str, Any]
         if text is not None:
@@ -110,16 +117,40 @@ class SentenceChunker(CloudChunker):
             raise ValueError("No text or file provided. Please provide either text or a file path.")
 
         # Make the request to the Chonkie API
-        response = requests.post(
-            f"{self.BASE_URL}/{self.VERSION}/chunk/sentence",
-            json=payload,
-            headers={"Authorization": f"Bearer {self.api_key}"},
-        )
+        try:
+            if ORJSON_AVAILABLE:
+                response = self._session.post(
+                    f"{self.BASE_URL}/{self.VERSION}/chunk/sentence",
+                    data=orjson.dumps(payload),
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json",
+                    },
+                )
+            else:
+                response = self._session.post(
+                    f"{self.BASE_URL}/{self.VERSION}/chunk/sentence",
+                    json=payload,
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+            raise ValueError(
+                "Oh no! You caught Chonkie at a bad time. It seems to be down right now."
+                + "Please try again in a short while."
+                + "If the issue persists, please contact support at support@chonkie.ai or raise an issue on GitHub."
+            ) from error
+        if response.status_code >= 500:
+            raise ValueError(
+                "Oh no! You caught Chonkie at a bad time. It seems to be down right now."
+                + "Please try again in a short while."
+                + "If the issue persists, please contact support at support@chonkie.ai or raise an issue on GitHub."
+            )
 
         # Parse the response
         try:
+            result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             if isinstance(text, list):
-                batch_result: List[List[Dict]] = cast(List[List[Dict]], response.json())
+                batch_result: List[List[Dict]] = cast(List[List[Dict]], result)
                 batch_chunks: List[List[Chunk]] = []
                 for chunk_list in batch_result:
                     curr_chunks: List[Chunk] = []
@@ -128,7 +159,7 @@ class SentenceChunker(CloudChunker):
                     batch_chunks.append(curr_chunks)
                 return batch_chunks
             else:
-                single_result: List[Dict] = cast(List[Dict], response.json())
+                single_result: List[Dict] = cast(List[Dict], result)
                 single_chunks: List[Chunk] = [Chunk.from_dict(chunk) for chunk in single_result]
                 return single_chunks
         except Exception as error:
@@ -3,8 +3,6 @@
 import os
 from typing import Any, Dict, List, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
@@ -39,6 +37,8 @@ class SlumberChunker(CloudChunker):
             api_key (Optional[str]): The Chonkie API key.
 
         """
+        import requests
+
         self.api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not self.api_key:
             raise ValueError(
@@ -86,6 +86,8 @@ class SlumberChunker(CloudChunker):
             List[Dict]: A list of dictionaries representing the chunks or texts.
 
         """
+        import requests
+
         payload: Dict[str, Any]
         if text is not None:
             payload = {
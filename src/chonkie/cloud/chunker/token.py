@@ -3,8 +3,6 @@
 import os
 from typing import Any, Dict, List, Optional, Union, cast
 
-import requests
-
 from chonkie.cloud.file import FileManager
 from chonkie.types import Chunk
 
@@ -25,6 +23,8 @@ class TokenChunker(CloudChunker):
         api_key: Optional[str] = None,
     ) -> None:
         """Initialize the Cloud TokenChunker."""
+        import requests
+
         # If no API key is provided, use the environment variable
         self.api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not self.api_key:
@@ -58,6 +58,8 @@ class TokenChunker(CloudChunker):
 
     def chunk(self, text: Optional[Union[str, List[str]]] = None, file: Optional[str] = None) -> Union[List[Chunk], List[List[Chunk]]]:
         """Chunk the text into a list of chunks."""
+        import requests
+
         # Define the payload for the request
         payload: Dict[str, Any]
         if text is not None:
@@ -4,8 +4,6 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
-
 BASE_URL = "https://api.chonkie.ai"
 VERSION = "v1"
 
@@ -32,6 +30,8 @@ class FileManager:
 
     def upload(self, path: str) -> File:
         """Upload a file to the Chonkie API."""
+        import requests
+
         with open(path, "rb") as file:
             response = requests.post(f"{BASE_URL}/{VERSION}/files", files={"file": file}, headers={"Authorization": f"Bearer {self.api_key}"})
         if response.status_code != 201:
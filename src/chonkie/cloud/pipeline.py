@@ -5,8 +5,6 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import requests
-
 from chonkie.types import Chunk
 
 from .file import FileManager
@@ -159,6 +157,8 @@ class Pipeline:
             ValueError: If pipeline not found or API error occurs.
 
         """
+        import requests
+
         api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not api_key:
             raise ValueError(
@@ -211,6 +211,8 @@ class Pipeline:
             ValueError: If API error occurs.
 
         """
+        import requests
+
         api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not api_key:
             raise ValueError(
@@ -266,6 +268,8 @@ class Pipeline:
             ValueError: If API error occurs.
 
         """
+        import requests
+
         api_key = api_key or os.getenv("CHONKIE_API_KEY")
         if not api_key:
             raise ValueError(
@@ -366,6 +370,8 @@ class Pipeline:
             ValueError: If pipeline already exists or API error occurs.
 
         """
+        import requests
+
         if not self._steps:
             raise ValueError("Cannot save pipeline with no steps.")
 
@@ -406,6 +412,8 @@ class Pipeline:
             ValueError: If pipeline doesn't exist or API error occurs.
 
         """
+        import requests
+
         payload: Dict[str, Any] = {}
 
         if description is not None:
@@ -442,6 +450,8 @@ class Pipeline:
             ValueError: If pipeline doesn't exist or API error occurs.
 
         """
+        import requests
+
         response = requests.delete(
             f"{self.BASE_URL}/{self.VERSION}/pipeline/{self._slug}",
             headers=self._get_headers(),
@@ -473,6 +483,8 @@ class Pipeline:
             ValueError: If neither text nor file provided, or API error occurs.
 
         """
+        import requests
+
         if text is None and file is None:
             raise ValueError("Either 'text' or 'file' must be provided.")
         if text is not None and file is not None:
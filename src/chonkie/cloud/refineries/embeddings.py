@@ -3,7 +3,6 @@ import os
 from typing import Any, Dict, List, Optional, cast
 
 import numpy as np
-import requests
 
 from .base import BaseRefinery
 
@@ -43,6 +42,8 @@ class EmbeddingsRefinery(BaseRefinery):
             ValueError: If all chunks are not of the same type.
 
         """
+        import requests
+
         # Define the payload for the request
         if any(type(chunk) != type(chunks[0]) for chunk in chunks):
             raise ValueError("All chunks must be of the same type.")
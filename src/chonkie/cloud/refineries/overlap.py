@@ -2,8 +2,6 @@
 import os
 from typing import Any, Dict, List, Literal, Optional, Union, cast
 
-import requests
-
 from .base import BaseRefinery
 
 
@@ -63,6 +61,8 @@ class OverlapRefinery(BaseRefinery):
             ValueError: If all chunks are not of the same type.
 
         """
+        import requests
+
         # Define the payload for the request
         if any(type(chunk) != type(chunks[0]) for chunk in chunks):
             raise ValueError("All chunks must be of the same type.")
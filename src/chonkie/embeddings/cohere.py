@@ -6,7 +6,6 @@ import warnings
 from typing import TYPE_CHECKING, List, Optional
 
 import numpy as np
-import requests
 
 from .base import BaseEmbeddings
 
@@ -70,6 +69,8 @@ class CohereEmbeddings(BaseEmbeddings):
             show_warnings: whether to show warnings about token usage and truncation
 
         """
+        import requests
+
         super().__init__()
 
         # Lazy import dependencies if they are not already imported
@@ -6,7 +6,6 @@ import warnings
 from typing import TYPE_CHECKING, List, Optional
 
 import numpy as np
-import requests
 
 from .base import BaseEmbeddings
 
@@ -112,6 +111,8 @@ class JinaEmbeddings(BaseEmbeddings):
             requests.exceptions.RequestException: If the API request fails after retries.
 
         """
+        import requests
+
         if not text:
             raise ValueError("Input text cannot be empty")
 
@@ -162,6 +163,8 @@ class JinaEmbeddings(BaseEmbeddings):
                 (either batch or single fallback).
 
         """
+        import requests
+
         if not texts:
             return []
             
@@ -5,7 +5,7 @@ import inspect
 import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, Dict, Protocol, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Protocol, Sequence, Tuple, Union
 
 if TYPE_CHECKING:
     import tiktoken
@@ -182,6 +182,18 @@ class Tokenizer(ABC):
         """
         return [self.count_tokens(text) for text in texts]
 
+    def encode_with_offsets(self, text: str) -> Tuple[Sequence[int], Sequence[int]]:
+        """Encode the given text and return the character offset where each token starts.
+
+        Args:
+            text (str): The text to encode.
+
+        Returns:
+            Tuple of the encoded sequence and the start offset of each token
+
+        """
+        raise NotImplementedError("Encoding with offsets not implemented for base tokenizer.")
+
 
 class CharacterTokenizer(Tokenizer):
     """Character-based tokenizer."""
@@ -212,13 +224,14 @@ class CharacterTokenizer(Tokenizer):
             Encoded sequence
 
         """
-        encoded = []
-        for token in text:
+        # Add the unseen characters to the vocabulary once, in order of first appearance,
+        # so that encoding the text itself is a plain lookup per character
+        for token in dict.fromkeys(text):
             id = self.token2id[token]
             if id >= len(self.vocab):
                 self.vocab.append(token)
-            encoded.append(id)
-        return encoded
+        token2id = self.token2id
+        return [token2id[token] for token in text]
 
     def decode(self, tokens: Sequence[int]) -> str:
         """Decode the given tokens back into text.
@@ -249,6 +262,19 @@ class CharacterTokenizer(Tokenizer):
         """
         return len(text)
 
+    def encode_with_offsets(self, text: str) -> Tuple[Sequence[int], Sequence[int]]:
+        """Encode the given text and return the character offset where each token starts.
+
+        Args:
+            text (str): The text to encode.
+
+        Returns:
+            Tuple of the encoded sequence and the start offset of each token
+
+        """
+        # Every character is a token, so the offsets are a range rather than a list
+        return self.encode(text), range(len(text))
+
 
 class WordTokenizer(Tokenizer):
     """Word-based tokenizer."""
@@ -308,6 +334,23 @@ class WordTokenizer(Tokenizer):
         """
         return len(self.tokenize(text))
 
+    def encode_with_offsets(self, text: str) -> Tuple[Sequence[int], Sequence[int]]:
+        """Encode the given text and return the character offset where each token starts.
+
+        Args:
+            text (str): The text to encode.
+
+        Returns:
+            Tuple of the encoded sequence and the start offset of each token
+
+        """
+        offsets = []
+        current_offset = 0
+        for token in self.tokenize(text):
+            offsets.append(current_offset)
+            current_offset += len(token) + 1  # +1 for the space separator
+        return self.encode(text), offsets
+
 
 class AutoTokenizer:
     """Auto-loading tokenizer interface for Chonkie.
@@ -471,6 +514,40 @@ class AutoTokenizer:
             return self.tokenizer(text)  # type: ignore
         raise ValueError(f"Unsupported tokenizer backend: {self._backend}")
 
+    def encode_with_offsets(self, text: str) -> Tuple[Sequence[int], Sequence[int]]:
+        """Encode the text and return the character offset where each token starts.
+
+        Args:
+            text (str): The text to encode.
+
+        Returns:
+            Tuple of the encoded sequence and the start offset of each token
+
+        Raises:
+            NotImplementedError: If the backend cannot provide token offsets.
+
+        """
+        if self._backend == "chonkie":
+            return self.tokenizer.encode_with_offsets(text)  # type: ignore
+        elif self._backend == "tiktoken":
+            tokens = self.tokenizer.encode(text)  # type: ignore
+            _, offsets = self.tokenizer.decode_with_offsets(tokens)  # type: ignore
+            return tokens, offsets
+        elif self._backend == "transformers":
+            if not getattr(self.tokenizer, "is_fast", False):
+                raise NotImplementedError("Encoding with offsets requires a fast transformers tokenizer.")
+            encoded = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)  # type: ignore
+            return encoded["input_ids"], [start for start, _ in encoded["offset_mapping"]]
+        elif self._backend == "tokenizers":
+            # A truncating (or padding) tokenizer would drop (or add) tokens of the whole text
+            if self.tokenizer.truncation is not None or self.tokenizer.padding is not None:  # type: ignore
+                raise NotImplementedError("Encoding with offsets not implemented for truncating or padding tokenizers.")
+            encoding = self.tokenizer.encode(text, add_special_tokens=False)  # type: ignore
+            return encoding.ids, [start for start, _ in encoding.offsets]
+        elif self._backend == "callable":
+            raise NotImplementedError("Encoding with offsets not implemented for callable tokenizers.")
+        raise ValueError(f"Unsupported tokenizer backend: {self._backend}")
+
     def encode_batch(self, texts: Sequence[str]) -> Sequence[Sequence[int]]:
         """Batch encode a list of texts into tokens.
 
@@ -489,7 +566,7 @@ class AutoTokenizer:
             encoded = self.tokenizer.batch_encode_plus(texts, add_special_tokens=False)  # type: ignore
             return encoded["input_ids"]  # type: ignore
         elif self._backend == "tokenizers":
-            return [encoding.ids for encoding in self.tokenizer.encode_batch(texts)]  # type: ignore
+            return [encoding.ids for encoding in self.tokenizer.encode_batch(texts, add_special_tokens=False)]  # type: ignore
         if self._backend == "callable":
             raise NotImplementedError(
                 "Batch encoding not implemented for callable tokenizers."
@@ -1,4 +1,7 @@
 """Test the CodeChunker class."""
+import importlib
+from typing import Any
+
 import pytest
 
 from chonkie import CodeChunker
@@ -59,7 +62,8 @@ def test_code_chunker_initialization() -> None:
 
 def test_code_chunker_chunking_python(python_code: str) -> None:
     """Test basic chunking of Python code."""
-    chunker = CodeChunker(language="python", chunk_size=50, include_nodes=True)
+    with pytest.warns(UserWarning, match="include_nodes"):
+        chunker = CodeChunker(language="python", chunk_size=50, include_nodes=True)
     chunks = chunker.chunk(python_code)
 
     assert isinstance(chunks, list)
@@ -103,6 +107,72 @@ def test_code_chunker_indices_python(python_code: str) -> None:
     assert current_index == len(python_code)
 
 
+def test_code_chunker_character_token_counts(python_code: str) -> None:
+    """Test that the character tokenizer counts every character, multi-byte ones included."""
+    code = python_code.replace("Hello", "Héllo 👋")
+    chunker = CodeChunker(language="python", chunk_size=64)
+    chunks = chunker.chunk(code)
+    assert "".join(chunk.text for chunk in chunks) == code
+    assert all(chunk.token_count == len(chunk.text) for chunk in chunks)
+
+
+def test_code_chunker_callable_tokenizer(python_code: str) -> None:
+    """Test chunking with a tokenizer that cannot provide token offsets."""
+    chunker = CodeChunker(tokenizer=lambda text: len(text.split()), language="python", chunk_size=10)
+    chunks = chunker.chunk(python_code)
+    assert len(chunks) > 1
+    assert all(chunk.token_count > 0 for chunk in chunks)
+    reconstructed_text = "".join(chunk.text for chunk in chunks)
+    assert reconstructed_text == python_code
+
+
+@pytest.fixture
+def bpe_tokenizer(python_code: str) -> Any:
+    """Return a byte-level BPE tokenizer trained on the Python code sample."""
+    tokenizers = pytest.importorskip("tokenizers")
+
+    # A byte-level BPE starts most tokens on the whitespace before them, outside of any node
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.BPE())
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = tokenizers.decoders.ByteLevel()
+    trainer = tokenizers.trainers.BpeTrainer(
+        vocab_size=300, initial_alphabet=tokenizers.pre_tokenizers.ByteLevel.alphabet(), show_progress=False
+    )
+    tokenizer.train_from_iterator([python_code], trainer)
+    return tokenizer
+
+
+def test_code_chunker_bpe_tokenizer_token_counts(bpe_tokenizer: Any, python_code: str) -> None:
+    """Test that a BPE tokenizer's tokens in the gaps between nodes are counted in the chunks."""
+    tokenizer = bpe_tokenizer
+
+    def count_tokens(text: str) -> int:
+        return len(tokenizer.encode(text).ids)
+
+    chunker = CodeChunker(tokenizer=tokenizer, language="python", chunk_size=32)
+    chunks = chunker.chunk(python_code)
+    assert "".join(chunk.text for chunk in chunks) == python_code
+    assert sum(chunk.token_count for chunk in chunks) == count_tokens(python_code)
+    # Re-tokenizing a chunk on its own only changes the tokens merged across its edges
+    assert all(abs(count_tokens(chunk.text) - chunk.token_count) <= 2 for chunk in chunks)
+
+    chunks = CodeChunker(tokenizer=tokenizer, language="python", chunk_size=4).chunk("x = foo(bar, baz) + qux * 2\n")
+    assert sum(chunk.token_count for chunk in chunks) == count_tokens("x = foo(bar, baz) + qux * 2\n")
+
+
+def test_code_chunker_truncating_tokenizer(bpe_tokenizer: Any, python_code: str) -> None:
+    """Test that a truncating tokenizer still counts the nodes past its maximum length."""
+    code = python_code * 4
+
+    # Truncating the whole document would leave every node past max_length with no tokens
+    bpe_tokenizer.enable_truncation(64)
+    chunks = CodeChunker(tokenizer=bpe_tokenizer, language="python", chunk_size=32).chunk(code)
+    bpe_tokenizer.no_truncation()
+    assert "".join(chunk.text for chunk in chunks) == code
+    assert all(chunk.token_count > 0 for chunk in chunks)
+    assert all(len(bpe_tokenizer.encode(chunk.text).ids) <= 64 for chunk in chunks)
+
+
 def test_code_chunker_return_type_chunks(python_code: str) -> None:
     """Test that chunker returns Chunk objects."""
     chunker = CodeChunker(language="python", chunk_size=50)
@@ -114,6 +184,46 @@ def test_code_chunker_return_type_chunks(python_code: str) -> None:
     assert reconstructed_text == python_code
 
 
+def test_code_chunker_pickle(python_code: str) -> None:
+    """Test that the CodeChunker can be pickled and still chunks the same."""
+    import pickle
+
+    chunker = CodeChunker(language="python", chunk_size=50)
+    restored = pickle.loads(pickle.dumps(chunker))
+    assert restored.parser is not None
+    assert [chunk.text for chunk in restored.chunk(python_code)] == [chunk.text for chunk in chunker.chunk(python_code)]
+
+
+def test_code_chunker_chunk_batch(python_code: str) -> None:
+    """Test that batch chunking matches chunking each text on its own."""
+    chunker = CodeChunker(language="python", chunk_size=50)
+    # More texts than parsing workers, so that the texts are parsed over several windows
+    texts = [python_code, "", python_code[:120], python_code[40:]] * 5
+    batch_chunks = chunker.chunk_batch(texts, show_progress=False)
+    assert len(batch_chunks) == len(texts)
+    for text, chunks in zip(texts, batch_chunks):
+        assert [chunk.text for chunk in chunks] == [chunk.text for chunk in chunker.chunk(text)]
+
+
+@pytest.mark.parametrize("chunk_size", [8, 32, 128])
+@pytest.mark.parametrize("tokenizer", ["character", lambda text: len(text.split())])
+def test_code_chunker_group_fallback(
+    monkeypatch: pytest.MonkeyPatch, python_code: str, js_code: str, chunk_size: int, tokenizer: Any
+) -> None:
+    """Test that the Python fallback of the node grouping chunks like the Cython group_child_indices."""
+    code_module = importlib.import_module("chonkie.chunker.code")
+    if not code_module.GROUP_CYTHON_AVAILABLE:
+        pytest.skip("Cython group_child_indices is not available")
+
+    for language, code in [("python", python_code), ("javascript", js_code)]:
+        chunker = CodeChunker(tokenizer=tokenizer, language=language, chunk_size=chunk_size)
+        expected = [(chunk.text, chunk.start_index, chunk.end_index, chunk.token_count) for chunk in chunker.chunk(code)]
+        with monkeypatch.context() as patch:
+            patch.setattr(code_module, "GROUP_CYTHON_AVAILABLE", False)
+            chunks = chunker.chunk(code)
+        assert [(chunk.text, chunk.start_index, chunk.end_index, chunk.token_count) for chunk in chunks] == expected
+
+
 def test_code_chunker_empty_input() -> None:
     """Test chunking an empty string."""
     chunker = CodeChunker(language="python")
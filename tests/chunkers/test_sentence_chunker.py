@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import List
+import importlib
+from typing import List, Optional
+from unittest.mock import patch
 
 import pytest
 from tokenizers import Tokenizer
 
 from chonkie import Chunk, SentenceChunker
+from chonkie.chunker.sentence import _get_hub_recipe
 
 
 @pytest.fixture
@@ -279,6 +282,61 @@ def test_sentence_chunker_min_characters_per_sentence(tokenizer: Tokenizer, samp
     assert len(chunks) == 1
     assert chunks[0].text == "Hello!"
 
+@pytest.mark.parametrize("include_delim", ["prev", "next", None])
+@pytest.mark.parametrize("delim", [[". ", "! ", "? ", "\n"], [". ", ".", "\n"], []])
+def test_sentence_chunker_split_text_fallback(
+    monkeypatch: pytest.MonkeyPatch, sample_text: str, delim: List[str], include_delim: Optional[str]
+) -> None:
+    """Test that the Python fallback of _split_text splits like the Cython split_text."""
+    sentence_module = importlib.import_module("chonkie.chunker.sentence")
+    if not sentence_module.SPLIT_AVAILABLE:
+        pytest.skip("Cython split_text is not available")
+
+    chunker = SentenceChunker(delim=delim, include_delim=include_delim)
+    expected = chunker._split_text(sample_text)
+    monkeypatch.setattr(sentence_module, "SPLIT_AVAILABLE", False)
+    assert chunker._split_text(sample_text) == expected
+    assert chunker._split_text("no delimiters here") == ["no delimiters here"]
+
+def test_sentence_chunker_token_count_cache() -> None:
+    """Test that repeated sentences are only sent to the tokenizer once."""
+    counted_texts = []
+
+    def tokenizer(text: str) -> int:
+        counted_texts.append(text)
+        return len(text.split())
+
+    sentences = ["This is a repeated sentence. ", "This is another sentence. "]
+    text = "".join(sentences) * 10
+    chunker = SentenceChunker(tokenizer=tokenizer, chunk_size=16)
+    chunks = chunker.chunk(text)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert [counted_texts.count(sentence) for sentence in sentences] == [1, 1]
+
+    # Chunking the same text again is served from the cache, and gives the same chunks
+    counted_texts.clear()
+    assert [chunk.text for chunk in chunker.chunk(text)] == [chunk.text for chunk in chunks]
+    assert not any(sentence in counted_texts for sentence in sentences)
+
+    chunker.clear_cache()
+    assert not chunker._token_count_cache
+
+def test_sentence_chunker_short_text_single_count() -> None:
+    """Test that a text fitting in a single chunk is counted once, without splitting it."""
+    counted_texts = []
+
+    def tokenizer(text: str) -> int:
+        counted_texts.append(text)
+        return len(text.split())
+
+    text = "Hello, how are you? I am doing well."
+    chunker = SentenceChunker(tokenizer=tokenizer, chunk_size=64)
+    chunks = chunker.chunk(text)
+    assert [(chunk.text, chunk.start_index, chunk.end_index, chunk.token_count) for chunk in chunks] == [
+        (text, 0, len(text), 8)
+    ]
+    assert counted_texts == [text]
+
 def test_sentence_chunker_from_recipe_default() -> None:
     """Test that SentenceChunker.from_recipe works with default parameters."""
     chunker = SentenceChunker.from_recipe()
@@ -320,6 +378,35 @@ def test_sentence_chunker_from_recipe_custom_lang() -> None:
     except (OSError, ValueError, ConnectionError, Exception) as e:
         pytest.skip(f"Could not download recipe (likely network/rate limit issue): {e}")
 
+def test_sentence_chunker_from_recipe_cached() -> None:
+    """Test that SentenceChunker.from_recipe gets each recipe from the hub only once."""
+    recipe = {"recipe": {"delimiters": [". ", "\n"], "include_delim": "next"}}
+    _get_hub_recipe.cache_clear()
+    try:
+        with patch("chonkie.chunker.sentence.Hubbie") as hubbie:
+            hubbie.return_value.get_recipe.return_value = recipe
+            chunkers = [SentenceChunker.from_recipe(chunk_size=256) for _ in range(3)]
+        hubbie.return_value.get_recipe.assert_called_once_with("default", "en")
+    finally:
+        _get_hub_recipe.cache_clear()
+
+    assert all(chunker.delim == [". ", "\n"] for chunker in chunkers)
+    assert all(chunker.include_delim == "next" for chunker in chunkers)
+
+    # The chunkers do not share the cached delimiter list
+    chunkers[0].delim.append("! ")
+    assert chunkers[1].delim == [". ", "\n"]
+    assert recipe["recipe"]["delimiters"] == [". ", "\n"]
+
+def test_sentence_chunker_from_recipe_path_not_cached() -> None:
+    """Test that SentenceChunker.from_recipe reads a recipe from a path every time."""
+    recipe = {"recipe": {"delimiters": [". "], "include_delim": "prev"}}
+    with patch("chonkie.chunker.sentence.Hubbie") as hubbie:
+        hubbie.return_value.get_recipe.return_value = recipe
+        SentenceChunker.from_recipe(path="recipe.json")
+        SentenceChunker.from_recipe(path="recipe.json")
+    assert hubbie.return_value.get_recipe.call_count == 2
+
 def test_sentence_chunker_from_recipe_nonexistent() -> None:
     """Test that SentenceChunker.from_recipe raises an error if the recipe does not exist."""
     with pytest.raises(ValueError):
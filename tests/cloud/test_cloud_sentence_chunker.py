@@ -1,5 +1,8 @@
 """Test for the Chonkie Cloud Sentence Chunker class."""
 
+import json
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
@@ -41,18 +44,15 @@ def mock_api_response():
 
 @pytest.fixture
 def mock_requests_get():
-    """Mock requests.get for API availability check."""
+    """Mock requests.get, to check that no API availability check is made."""
     with patch('requests.get') as mock_get:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
         yield mock_get
 
 
 @pytest.fixture
 def mock_requests_post():
     """Mock requests.post for API chunking calls."""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         yield mock_post
 
 
@@ -132,6 +132,7 @@ def test_cloud_sentence_chunker_simple(mock_requests_get, mock_requests_post, mo
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_api_response(text)
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_post.return_value = mock_response
     
     sentence_chunker = SentenceChunker(
@@ -179,6 +180,7 @@ def test_cloud_sentence_chunker_multiple_sentences(mock_requests_get, mock_reque
         }
     ]
     mock_response.json.return_value = chunks
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_post.return_value = mock_response
     
     sentence_chunker = SentenceChunker(
@@ -207,6 +209,7 @@ def test_cloud_sentence_chunker_batch(mock_requests_get, mock_requests_post, moc
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_api_response(texts)
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_post.return_value = mock_response
     
     sentence_chunker = SentenceChunker(
@@ -226,3 +229,49 @@ def test_cloud_sentence_chunker_batch(mock_requests_get, mock_requests_post, moc
     assert all(isinstance(item.token_count, int) for item in result[0])
     assert all(isinstance(item.start_index, int) for item in result[0])
     assert all(isinstance(item.end_index, int) for item in result[0])
+
+
+def test_cloud_sentence_chunker_no_health_check(mock_requests_get) -> None:
+    """Test that initializing the sentence chunker makes no request to the API."""
+    SentenceChunker(tokenizer="gpt2", chunk_size=512, api_key="test_key")
+    mock_requests_get.assert_not_called()
+
+
+def test_cloud_sentence_chunker_api_down(mock_requests_post) -> None:
+    """Test that a server error on chunking reports that the API is down."""
+    mock_response = Mock()
+    mock_response.status_code = 503
+    mock_requests_post.return_value = mock_response
+
+    sentence_chunker = SentenceChunker(tokenizer="gpt2", chunk_size=512, api_key="test_key")
+    with pytest.raises(ValueError, match="Oh no! You caught Chonkie at a bad time"):
+        sentence_chunker("Hello, world!")
+
+
+def test_cloud_sentence_chunker_session_retries() -> None:
+    """Test that the sentence chunker's session retries failed connections to the API."""
+    sentence_chunker = SentenceChunker(tokenizer="gpt2", chunk_size=512, api_key="test_key")
+    adapter = sentence_chunker._session.get_adapter(sentence_chunker.BASE_URL)
+    assert adapter.max_retries.total == 2
+
+
+def test_cloud_sentence_chunker_stdlib_json(mock_requests_post, mock_api_response) -> None:
+    """Test that the sentence chunker falls back to the stdlib json without orjson."""
+    text = "Hello, world!"
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = mock_api_response(text)
+    mock_requests_post.return_value = mock_response
+
+    sentence_chunker = SentenceChunker(tokenizer="gpt2", chunk_size=512, api_key="test_key")
+    with patch("chonkie.cloud.chunker.sentence.ORJSON_AVAILABLE", False):
+        result = sentence_chunker(text)
+
+    assert len(result) == 1 and result[0].text == text
+    assert mock_requests_post.call_args.kwargs["json"]["text"] == text
+
+
+def test_cloud_sentence_chunker_lazy_requests() -> None:
+    """Test that importing chonkie does not import requests before an API call needs it."""
+    code = "import sys, chonkie; assert 'requests' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
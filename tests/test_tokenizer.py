@@ -368,6 +368,14 @@ def test_word_tokenizer_vocab_appends_new_words(
         assert word in word_tokenizer.vocab
 
 
+def test_word_tokenizer_encode_with_offsets(word_tokenizer: WordTokenizer) -> None:
+    """Test encoding with offsets with WordTokenizer."""
+    text = "the quick  brown fox"
+    tokens, offsets = word_tokenizer.encode_with_offsets(text)
+    assert tokens == word_tokenizer.encode(text)
+    assert [text[offset:].split(" ")[0] for offset in offsets] == text.split(" ")
+
+
 def test_word_tokenizer_repr() -> None:
     """Test string representation of tokenizers."""
     word_tokenizer = WordTokenizer()
@@ -454,6 +462,15 @@ def test_character_tokenizer_count_tokens_batch(
     assert counts == [len(text) for text in sample_text_list]
 
 
+def test_character_tokenizer_encode_with_offsets(
+    character_tokenizer: CharacterTokenizer, sample_text: str
+) -> None:
+    """Test encoding with offsets with CharacterTokenizer."""
+    tokens, offsets = character_tokenizer.encode_with_offsets(sample_text)
+    assert tokens == character_tokenizer.encode(sample_text)
+    assert list(offsets) == list(range(len(sample_text)))
+
+
 def test_character_tokenizer_repr() -> None:
     """Test string representation of tokenizers."""
     character_tokenizer = CharacterTokenizer()
@@ -806,6 +823,14 @@ def test_tokenizer_encode_batch_callable_error() -> None:
         callable_tokenizer.encode_batch(["hello world", "test"])
 
 
+def test_tokenizer_encode_with_offsets_callable_error() -> None:
+    """Test that encode_with_offsets raises NotImplementedError for callable tokenizers."""
+    callable_tokenizer = AutoTokenizer(lambda x: len(x.split()))
+
+    with pytest.raises(NotImplementedError, match="Encoding with offsets not implemented"):
+        callable_tokenizer.encode_with_offsets("hello world")
+
+
 def test_base_tokenizer_abstract_methods() -> None:
     """Test that BaseTokenizer cannot be instantiated with missing abstract methods."""
     from chonkie.tokenizer import Tokenizer as BaseTokenizer